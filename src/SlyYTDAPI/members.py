@@ -8,7 +8,9 @@ from typing import Any, TypedDict, cast
 from SlyAPI.oauth2 import OAuth2
 from SlyAPI import *
 from SlyAPI.web import JsonMap, ParamsDict
-from .ytdapi import YouTubeData, Part, yt_date
+from .ytdapi import YouTubeData, Part, yt_date, _parts_param
+
+_MEMBERSHIPS_LEVEL_PARTS = frozenset({Part.ID, Part.SNIPPET})
 
 class _MembersPollResponse(TypedDict):
     kind: str
@@ -22,11 +24,13 @@ class _MembersLevelsResponse(TypedDict):
     etag: str
     items: list[dict[str, Any]]
 
-class MembersMode(Enum):
+class MembersMode(str, Enum):
     ALL_CURRENT = 'all_current'
     UPDATES = 'updates'
 
 class MemberLevel:
+    __slots__ = ('id', 'name')
+
     # part: id
     id: str
     # part: snippet
@@ -52,6 +56,11 @@ class MemberLevel:
                 raise ValueError(f'Invalid source: {source}')
 
 class Membership:
+    __slots__ = (
+        'channel_id', 'channel_name', 'profile_image_url', 'level',
+        'since', 'total_months', 'since_at_level', 'total_months_at_level',
+    )
+
     # part: snippet
     channel_id: str
     channel_name: str
@@ -65,14 +74,17 @@ class Membership:
     def __init__(self, source: dict[str, Any]):
 
         snippet = source['snippet']
-        self.channel_id = snippet['memberDetails']['channelId']
-        self.channel_name = snippet['memberDetails']['displayName']
-        self.profile_image_url = snippet['memberDetails']['profileImageUrl']
+        member = snippet['memberDetails']
+        duration = snippet['membershipsDuration']
+        duration_at_level = snippet['membershipsDurationAtLevel']
+        self.channel_id = member['channelId']
+        self.channel_name = member['displayName']
+        self.profile_image_url = member['profileImageUrl']
         self.level= MemberLevel(snippet['membershipsDetails'])
-        self.since = yt_date(snippet['membershipsDuration']['memberSince'])
-        self.total_months = snippet['membershipsDuration']['memberTotalDurationMonths']
-        self.since_at_level = yt_date(snippet['membershipsDurationAtLevel']['memberSince'])
-        self.total_months_at_level = snippet['membershipsDurationAtLevel']['memberTotalDurationMonths']
+        self.since = yt_date(duration['memberSince'])
+        self.total_months = duration['memberTotalDurationMonths']
+        self.since_at_level = yt_date(duration_at_level['memberSince'])
+        self.total_months_at_level = duration_at_level['memberTotalDurationMonths']
         
 class YouTubeData_WithMembers(YouTubeData):
 
@@ -89,8 +101,8 @@ class YouTubeData_WithMembers(YouTubeData):
             raise ValueError('Cannot fetch more than 100 specific members.')
         mode = MembersMode.ALL_CURRENT
         params: ParamsDict = {
-            'part': Part.SNIPPET,
-            'mode': mode,
+            'part': Part.SNIPPET.value,
+            'mode': mode.value,
             'hasAccessToLevel': level_id,
             'filterByMemberChannelId': ','.join(member_channel_ids or []),
             'maxResults': 1000 if limit is None else min(1000, limit)
@@ -101,14 +113,14 @@ class YouTubeData_WithMembers(YouTubeData):
     
     async def _members_poll(self, pageToken: str|None) -> _MembersPollResponse:
         params: ParamsDict = {
-            'part': Part.SNIPPET,
-            'membersMode': MembersMode.UPDATES,
+            'part': Part.SNIPPET.value,
+            'membersMode': MembersMode.UPDATES.value,
             'pageToken': pageToken
         }
         return cast(_MembersPollResponse, await self.get_json('/members', params))
     
     async def _memberships_levels(self, parts: Part|set[Part]) -> _MembersLevelsResponse:
-        params = { 'part': parts.intersection({Part.ID, Part.SNIPPET}) }
+        params = { 'part': _parts_param(parts, _MEMBERSHIPS_LEVEL_PARTS) }
         return cast(_MembersLevelsResponse, await self.get_json('/membershipsLevels', params))
 
     async def poll_new_members(self) -> list[Membership]:
@@ -1,12 +1,14 @@
-from dataclasses import dataclass, asdict, is_dataclass
-import inspect
+from dataclasses import dataclass, asdict
+import asyncio
 import re
+import sys
 from enum import Enum
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import TypeVar, Any
+from typing import AsyncGenerator, Callable, Generic, TypeVar, Any
 from warnings import warn
 from SlyAPI import *
-from SlyAPI.web import ParamsDict
+from SlyAPI.web import JsonMap, ParamsDict
 
 SCOPES_ROOT = 'https://www.googleapis.com/auth/youtube'
 
@@ -14,7 +16,7 @@ class Scope:
     READONLY     = F"{SCOPES_ROOT}.readonly"
     MEMBERS      = F"{SCOPES_ROOT}.channel-memberships.creator"
 
-class Part(Enum):
+class Part(str, Enum):
     ID                      = 'id'
     DETAILS                 = 'contentDetails'
     SNIPPET                 = 'snippet'
@@ -48,99 +50,211 @@ class Part(Enum):
     def intersection(self, other: 'set[Part]'):
         return {self}
 
-class PrivacyStatus(Enum):
+class PrivacyStatus(str, Enum):
     PRIVATE      = 'private'
     UNLISTED     = 'unlisted'
     PUBLIC       = 'public'
 
-class ProcessingStatus(Enum):
+class ProcessingStatus(str, Enum):
     FAILED       = 'failed'
     PROCESSING   = 'processing'
     SUCCEEDED    = 'succeeded'
     TERMINATED   = 'terminated'
 
-class SafeSearch(Enum):
+class SafeSearch(str, Enum):
     SAFE         = 'strict'
     MODERATE     = 'moderate'
     UNSAFE       = 'none'
 
-class Order(Enum):
+class Order(str, Enum):
     DATE         = 'date'
     LIKES        = 'rating'
     RELEVANCE    = 'relevance'
     ALPHABETICAL = 'title'
     VIEWS        = 'viewCount'
 
-class CommentOrder(Enum):
+class CommentOrder(str, Enum):
     RELEVANCE    = 'relevance'
     TIME         = 'time'
 
-ISO8601_PERIOD = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d{1,2})H)?(?:(\d{1,2})M)?(?:(\d{1,2})S)?)?')
+@lru_cache(maxsize=64)
+def _parts_str(parts: frozenset[Part]) -> str|None:
+    '''Comma separated part names for a request, or None if there are none.'''
+    return ','.join(sorted(parts)) or None
+
+def _parts_param(parts: Part|set[Part], allowed: frozenset[Part]) -> str|None:
+    return _parts_str(frozenset(parts.intersection(allowed)))
+
+ISO8601_PERIOD = re.compile(r'P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+
+# before 3.11, fromisoformat rejects a Z suffix and fractions other than 3 or 6 digits
+_FROMISOFORMAT_FULL = sys.version_info >= (3, 11)
 
 def yt_date(date: str) -> datetime:
     if not date:
         return
 
-    if date.endswith('Z'):
-        try:
-            return datetime.strptime(date, '%Y-%m-%dT%H:%M:%S.%fZ')
-        except ValueError:
-            return datetime.strptime(date, '%Y-%m-%dT%H:%M:%SZ')
-    else:
+    if _FROMISOFORMAT_FULL or date[-1] != 'Z':
         return datetime.fromisoformat(date)
-    
+    # fixed-width YYYY-MM-DDTHH:MM:SS[.f]Z, as returned by the API
+    elif len(date) >= 20 and date[10] == 'T' and (len(date) == 20 or date[19] == '.'):
+        return datetime(
+            int(date[0:4]), int(date[5:7]), int(date[8:10]),
+            int(date[11:13]), int(date[14:16]), int(date[17:19]),
+            int(date[20:-1][:6].ljust(6, '0')) if len(date) > 21 else 0,
+            timezone.utc)
+    else:
+        raise ValueError(F"Unknown date format: {date}")
+
+# seconds per unit, before and after the T of an ISO 8601 period
+_PERIOD_DATE_UNITS = {'W': 604800, 'D': 86400}
+_PERIOD_TIME_UNITS = {'H': 3600, 'M': 60, 'S': 1}
+
+def _parse_iso_duration(duration: str) -> int:
+    '''Total seconds in an ISO 8601 period such as `PT4M13S` or `P1DT2H`.'''
+    # single pass without the regex engine, which is only used for odd input
+    if duration[:1] == 'P':
+        units = _PERIOD_DATE_UNITS
+        total = number = 0
+        digits = False
+        last = 604801 # each unit must be smaller than the one before it
+        for c in duration[1:]:
+            if '0' <= c <= '9':
+                number = number * 10 + ord(c) - 48
+                digits = True
+            elif digits and c in units and units[c] < last:
+                last = units[c]
+                total += number * last
+                number = 0
+                digits = False
+            elif c == 'T' and not digits and units is _PERIOD_DATE_UNITS:
+                units = _PERIOD_TIME_UNITS
+            else:
+                break
+        else:
+            if not digits:
+                return total
+    m = ISO8601_PERIOD.fullmatch(duration)
+    if not m:
+        raise ValueError(F"Unknown duration format: {duration}")
+    weeks, days, hours, minutes, seconds = m.groups()
+    return (int(weeks) * 604800 if weeks else 0) \
+        + (int(days) * 86400 if days else 0) \
+        + (int(hours) * 3600 if hours else 0) \
+        + (int(minutes) * 60 if minutes else 0) \
+        + (int(seconds) if seconds else 0)
+
+def _iso_utc(date: datetime) -> str:
+    '''Format a date for a request, as UTC with a Z suffix.'''
+    # isoformat keeps any sub-second precision, which strftime('%S') would drop
+    return date.astimezone(timezone.utc).isoformat("T")[:-6] + "Z"
+
 def yt_date_or_none(date: str|None) -> datetime|None:
     if date is not None:
         return yt_date(date)
     else:
         return None
 
+# deprecated names which have already been warned about. A name counts as
+# warned once warn() returns, even if a warnings filter suppressed it.
+_warned: set[str] = set()
+
+def _warn_deprecated(old: str, new: str):
+    if old not in _warned:
+        warn(F"{old} is deprecated, please use {new}", DeprecationWarning, stacklevel=3)
+        _warned.add(old)
+
+# shared fallback for chained lookups into optional objects; never mutated
+_EMPTY: dict[str, Any] = {}
+
 W = TypeVar('W')
 T = TypeVar('T')
 
 def get_dict_path(d: dict[str, Any], *keys: str) -> Any:
     for key in keys:
-        if key not in d:
+        if not isinstance(d, dict) or key not in d:
             return None
         d = d[key]
     return d
-    
+
+class _LazySlot(Generic[T]):
+    '''
+    Read-only attribute built from a raw API value on first access.
+    The owner stores the raw value in the `_<name>_source` slot, and the
+    built value is kept in the `_<name>` slot. Both default to None if unset.
+    '''
+    def __init__(self, build: Callable[[Any, Any], T]):
+        self.build = build
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self.value_slot = F"_{name}"
+        self.source_slot = F"_{name}_source"
+
+    def __get__(self, obj: Any, objtype: type|None=None) -> T | None:
+        if obj is None:
+            return self # type: ignore
+        if (source := getattr(obj, self.source_slot, None)) is not None:
+            setattr(obj, self.value_slot, self.build(obj, source))
+            delattr(obj, self.source_slot)
+        return getattr(obj, self.value_slot, None)
+
+    def __set__(self, obj: Any, value: Any):
+        raise AttributeError(F"{self.value_slot[1:]} is read-only")
+
 class Comment:
+    __slots__ = (
+        'id', 'author_display_name', 'author_channel_id', 'body',
+        '_created_at', '_created_at_source',
+        '_replies', '_replies_source',
+    )
+
     id: str
     # part: snippet
     author_display_name: str
     author_channel_id: str
     body: str
-    created_at: datetime
+
+    @_LazySlot
+    def created_at(self, source: str) -> datetime:
+        '''Timestamp from the snippet, parsed on first access.'''
+        return yt_date(source)
+
     # part: replies
-    replies: list['Comment']|None
+    @_LazySlot
+    def replies(self, source: list[dict[str, Any]]) -> list['Comment']:
+        '''Replies to a top-level comment, built on first access.'''
+        return [Comment(r) for r in source]
 
     @property
     def author_name(self):
-        warn("author_name is deprecated, please use author_display_name")
+        _warn_deprecated('author_name', 'author_display_name')
         return self.author_display_name
 
     def __init__(self, source: dict[str, Any]):
-        # case of top-level comment
-        if tlc := source.get('snippet', {}).get('topLevelComment'):
-            replies: list[Any] = source.get('replies', {}).get('comments', [])
-            self.replies = [Comment(r) for r in replies]
+        snippet = source.get('snippet')
+        # case of top-level comment, replies have no topLevelComment
+        if snippet and (tlc := snippet.get('topLevelComment')):
+            replies = source.get('replies')
+            self._replies_source = replies['comments'] if replies else []
             source = tlc
-            
+            snippet = source.get('snippet')
+
         self.id = source['id']
-        if snippet := source.get('snippet'):
+        if snippet:
             self.author_display_name = snippet['authorDisplayName']
-            self.author_channel_id = snippet['authorChannelId']['value']
+            # commenters repeat a lot within one video, share their ID strings
+            self.author_channel_id = sys.intern(snippet['authorChannelId']['value'])
             self.body = snippet['textDisplay']
-            self.created_at = yt_date(snippet['publishedAt'])
+            self._created_at_source = snippet['publishedAt']
         
-@dataclass
+@dataclass(slots=True)
 class EmbedInfo:
     embedHtml: str
     embedHeight: int
     embedWidth: int
 
-@dataclass
+@dataclass(slots=True)
 class ContentDetails:
     duration: int
     is_licensed: bool
@@ -152,7 +266,7 @@ class ContentDetails:
     caption: str
     projection: str | None
 
-@dataclass
+@dataclass(slots=True)
 class StatusDetails:
     privacy: PrivacyStatus
     upload_status: str
@@ -165,15 +279,15 @@ class StatusDetails:
     # only if authorized by channel owner
     self_declared_made_for_kids: bool | None
 
-@dataclass
+@dataclass(slots=True)
 class VideoPublicStatistics:
     view_count: int
     like_count: int | None
     comment_count: int
 
-@dataclass
+@dataclass(slots=True)
 class FileDetails:
-    @dataclass
+    @dataclass(slots=True)
     class VideoStream:
         width: int
         height: int
@@ -185,7 +299,7 @@ class FileDetails:
         vendor: str
     videoStreams: list[VideoStream]
 
-    @dataclass
+    @dataclass(slots=True)
     class AudioStream:
         channels_count: int
         codec: str
@@ -202,7 +316,7 @@ class FileDetails:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class LivestreamDetails:
     # only available after stream starts
     viewers: int | None
@@ -214,7 +328,7 @@ class LivestreamDetails:
     scheduled_end: datetime | None
     chat_id: str
     
-@dataclass
+@dataclass(slots=True)
 class ProcessingDetails:
     status: ProcessingStatus
     parts_total: int | None
@@ -222,186 +336,269 @@ class ProcessingDetails:
     milliseconds_remaining: int | None
     failureReason: str | None
 
-@dataclass
+@dataclass(slots=True)
 class VideoLocalization:
     title: str
     description: str
 
 class Video:
+    __slots__ = (
+        '_youtube', 'id',
+        'title', 'description', '_published_at', '_published_at_source',
+        'channel_id', 'channel_name',
+        'tags', 'is_livestream', 'default_audio_language',
+        '_thumbnails', '_thumbnails_source',
+        'localized_title', 'localized_description',
+        'duration', 'content_details',
+        'privacy', 'status_details',
+        'view_count', 'like_count', 'comment_count',
+        'livestream_details',
+        'topic_categories',
+        'localizations',
+        'recorded_at',
+        'file_details',
+        'processing_details',
+    )
+
     _youtube: 'YouTubeData'
     id: str
 
     # part: snippet
     title: str
     description: str
-    published_at: datetime
     channel_id: str
     channel_name: str
     tags: list[str]
     is_livestream: bool
-    default_audio_language: str | None = None
-    thumbnails: list[str] | None = None
-    localized_title: str | None = None
-    localized_description: str | None = None
+    default_audio_language: str | None
+    localized_title: str | None
+    localized_description: str | None
+
+    @_LazySlot
+    def published_at(self, source: str) -> datetime:
+        '''Timestamp from the snippet, parsed on first access.'''
+        return yt_date(source)
+
+    @_LazySlot
+    def thumbnails(self, source: dict[str, Any]) -> list[str]:
+        '''Thumbnail image URLs, built on first access.'''
+        return [x.get("url") for x in source.values()]
 
     # part: contentDetails
-    duration: int | None = None
-    content_details: ContentDetails | None = None
+    duration: int | None
+    content_details: ContentDetails | None
 
     # part: status
-    privacy: PrivacyStatus | None = None
-    status_details: StatusDetails | None = None
+    privacy: PrivacyStatus | None
+    status_details: StatusDetails | None
 
     # part: statistics
-    view_count: int | None = 0
-    like_count: int | None = 0
+    view_count: int | None
+    like_count: int | None
 
     # dislike_count: int ## rest in peace
-    comment_count: int | None = 0
+    comment_count: int | None
 
     # part: liveStreamingDetails
-    livestream_details: LivestreamDetails | None = None
+    livestream_details: LivestreamDetails | None
     
     # part: topicDetails
-    topic_categories: list[str] | None = None
+    topic_categories: list[str] | None
     
     # part: localizations
-    localizations: dict[str, VideoLocalization] | None = None
+    localizations: dict[str, VideoLocalization] | None
     
     # part: recordingDetails
-    recorded_at: datetime | None = None
+    recorded_at: datetime | None
 
     # part: fileDetails
-    file_details: FileDetails | None = None
+    file_details: FileDetails | None
 
     # part: processingDetails
-    processing_details: ProcessingDetails | None = None
+    processing_details: ProcessingDetails | None
     
+    _TO_DICT_KEYS = (
+        'id',
+        'title', 'description', 'published_at', 'channel_id', 'channel_name',
+        'tags', 'is_livestream', 'default_audio_language', 'thumbnails',
+        'localized_title', 'localized_description',
+        'duration', 'content_details',
+        'privacy', 'status_details',
+        'view_count', 'like_count', 'comment_count',
+        'livestream_details',
+        'topic_categories',
+        'localizations',
+        'recorded_at',
+        'file_details',
+        'processing_details',
+    )
+    # members which are dataclasses, converted with asdict
+    _TO_DICT_RECORDS = (
+        'content_details', 'status_details', 'livestream_details',
+        'file_details', 'processing_details',
+    )
+
     def to_dict(self) -> dict[str, Any]:
         """
         Returns a dictionary representation of the Video object.
         """
-        return {
-            name: asdict(member) if is_dataclass(member) else member
-            for name, member in inspect.getmembers(self)
-            if not name.startswith('_')
-                and not inspect.isfunction(member)
-                and not inspect.ismethod(member)
-        }
+        d = {name: getattr(self, name, None) for name in self._TO_DICT_KEYS}
+        for name in self._TO_DICT_RECORDS:
+            if (record := d[name]) is not None:
+                d[name] = asdict(record)
+        return d
 
     def __init__(self, source: dict[str, Any], yt: 'YouTubeData'):
         self._youtube = yt
-        match source['id']:
-            case str():
-                self.id = source['id']
-            case dict(): # case for video search result object
-                self.id = source['id']['videoId']
-            case _:
-                raise ValueError("Video expects source id to be a string or dict")
-        
-        if snippet := source.get('snippet'):
-            self.title = snippet.get('title')
-            self.description = snippet.get('description')
-            self.published_at = yt_date(snippet.get('publishedAt'))
-            self.channel_id = snippet.get('channelId')
-            self.channel_name = snippet.get('channelTitle')
-            self.tags = snippet.get('tags', [])
-            self.is_livestream = snippet.get('liveBroadcastContent') == 'live'
-            self.default_audio_language = snippet.get('defaultAudioLanguage')
-
-            self.thumbnails = [x.get("url") for x in snippet.get("thumbnails", {}).values()]
-            self.localized_title = snippet.get("localized", {}).get("title")
-            self.localized_description = snippet.get("localized", {}).get("description")
-            
+        self.default_audio_language = None
+        self.localized_title = None
+        self.localized_description = None
+        self.duration = None
+        self.content_details = None
+        self.privacy = None
+        self.status_details = None
+        self.view_count = 0
+        self.like_count = 0
+        self.comment_count = 0
+        self.livestream_details = None
+        self.topic_categories = None
+        self.localizations = None
+        self.recorded_at = None
+        self.file_details = None
+        self.processing_details = None
+
+        id = source['id']
+        if type(id) is str:
+            self.id = id
+        elif type(id) is dict: # case for video search result object
+            self.id = id['videoId']
+        else:
+            raise ValueError("Video expects source id to be a string or dict")
+
+        skip = None
         if source.get('kind') == 'youtube#playlistItem':
-            self.id = source.get('contentDetails', {}).get('videoId')
-        elif contentDetails := source.get('contentDetails'):
-            
-            m = ISO8601_PERIOD.match(contentDetails.get('duration'))
-            if m:
-                days, hours, minutes, seconds = (int(g) if g else 0 for g in m.groups())
-                self.duration = days * 24 * 60 * 60 + hours * 60 * 60 + minutes * 60 + seconds
-            else:
-                raise ValueError(F"Unknown duration format: {contentDetails['duration']}")
-            self.content_details = ContentDetails(
-                self.duration,
-                contentDetails.get('licensedContent'),
-                contentDetails.get("regionRestriction", {}).get("blocked", []),
-                contentDetails.get("regionRestriction", {}).get("allowed", []),
-                contentDetails.get("contentRating", {}),
-                contentDetails.get("dimension"),
-                contentDetails.get("definition"),
-                contentDetails.get("caption"),
-                contentDetails.get("projection")
-            )
-
-        if status := source.get('status'):
-            self.privacy = status.get('privacyStatus')
-            self.status_details = StatusDetails(
-                status.get('privacyStatus'),
-                status.get('uploadStatus'),
-                status.get('failureReason'),
-                status.get('rejectionReason'),
-                status.get('license'),
-                status.get('embeddable'),
-                status.get('publicStatsViewable'),
-                status.get('madeForKids'),
-                status.get('selfDeclaredMadeForKids')
-            )
-
-        if statistics := source.get('statistics'):
-            self.view_count = int(statistics.get('viewCount', 0))
-            self.like_count = int(statistics.get('likeCount', 0))
-            self.comment_count = int(statistics.get('commentCount', 0))
-
-        if stream := source.get('liveStreamingDetails'):
-            self.livestream_details = LivestreamDetails(s
-                stream.get('concurrentViewers'),
-                yt_date_or_none(stream.get('actualStartTime')),
-                yt_date_or_none(stream.get('actualEndTime')),
-                yt_date(stream.get('scheduledStartTime')),
-                yt_date_or_none(stream.get('scheduledEndTime')),
-                stream.get('activeLiveChatId')
-            )
-
-        if topic_details := source.get('topicDetails'):
-            self.topic_categories = topic_details.get('topicCategories', None)
-
-        if recording_details := source.get('recordingDetails'):
-            self.recorded_at = yt_date(recording_details.get('recordingDate'))
-
-        if fileDetails := source.get('fileDetails'):
-            self.file_details = FileDetails(
-                [FileDetails.VideoStream(
-                    v.get('widthPixels'), v.get('heightPixels'), v.get('frameRateFps'),
-                    v.get('aspectRatio'), v.get('codec'), v.get('bitrateBps'),
-                    v.get('rotation'), v.get('vendor')
-                    ) for v in fileDetails.get('videoStreams')],
-                [FileDetails.AudioStream(
-                    a.get('channelCount'), a.get('codec'), a.get('bitrateBps'), a.get('vendor')
-                    ) for a in fileDetails.get('audioStreams')],
-                fileDetails.get('fileName'),
-                fileDetails.get('fileSize'),
-                fileDetails.get('fileType'),
-                fileDetails.get('container'),
-                fileDetails.get('durationMs'),
-                fileDetails.get('bitrateBps'),
-                yt_date(fileDetails.get('creationTime')),
-            )
-
-        if processingDetails := source.get('processingDetails'):
-            self.processing_details = ProcessingDetails(
-                processingDetails.get('processingStatus'),
-                processingDetails.get('processingProgress', {}).get('partsTotal'),
-                processingDetails.get('processingProgress', {}).get('partsProcessed'),
-                processingDetails.get('processingProgress', {}).get('timeLeftMs'),
-                processingDetails.get('processingFailureReason'),
-            )
-            
-        if localizations := source.get('localizations'):
-            self.localizations = {
-                k: VideoLocalization(**v) for k, v in localizations.items()
-            }
+            self.id = (source.get('contentDetails') or _EMPTY).get('videoId')
+            skip = 'contentDetails'
+        # readers run in the fixed order of _PART_READERS
+        for part, reader in self._PART_READERS.items():
+            if part != skip and (value := source.get(part)):
+                reader(self, value)
+
+    def _read_snippet(self, snippet: dict[str, Any]):
+        self.title = snippet.get('title')
+        self.description = snippet.get('description')
+        self._published_at_source = snippet.get('publishedAt')
+        # most listings are of one or few channels, share their strings
+        channel_id = snippet.get('channelId')
+        channel_name = snippet.get('channelTitle')
+        self.channel_id = sys.intern(channel_id) if channel_id else channel_id
+        self.channel_name = sys.intern(channel_name) if channel_name else channel_name
+        self.tags = snippet.get('tags', [])
+        self.is_livestream = snippet.get('liveBroadcastContent') == 'live'
+        self.default_audio_language = snippet.get('defaultAudioLanguage')
+
+        self._thumbnails_source = snippet.get("thumbnails") or _EMPTY
+        localized = snippet.get("localized") or _EMPTY
+        self.localized_title = localized.get("title")
+        self.localized_description = localized.get("description")
+
+    def _read_content_details(self, contentDetails: dict[str, Any]):
+        self.duration = _parse_iso_duration(contentDetails['duration'])
+        region = contentDetails.get("regionRestriction") or _EMPTY
+        self.content_details = ContentDetails(
+            self.duration,
+            contentDetails.get('licensedContent'),
+            region.get("blocked", []),
+            region.get("allowed", []),
+            contentDetails.get("contentRating", {}),
+            contentDetails.get("dimension"),
+            contentDetails.get("definition"),
+            contentDetails.get("caption"),
+            contentDetails.get("projection")
+        )
+
+    def _read_status(self, status: dict[str, Any]):
+        self.privacy = status.get('privacyStatus')
+        self.status_details = StatusDetails(
+            status.get('privacyStatus'),
+            status.get('uploadStatus'),
+            status.get('failureReason'),
+            status.get('rejectionReason'),
+            status.get('license'),
+            status.get('embeddable'),
+            status.get('publicStatsViewable'),
+            status.get('madeForKids'),
+            status.get('selfDeclaredMadeForKids')
+        )
+
+    def _read_statistics(self, statistics: dict[str, Any]):
+        get = statistics.get
+        self.view_count, self.like_count, self.comment_count = \
+            int(get('viewCount', 0)), int(get('likeCount', 0)), int(get('commentCount', 0))
+
+    def _read_livestream_details(self, stream: dict[str, Any]):
+        self.livestream_details = LivestreamDetails(
+            stream.get('concurrentViewers'),
+            yt_date_or_none(stream.get('actualStartTime')),
+            yt_date_or_none(stream.get('actualEndTime')),
+            yt_date(stream.get('scheduledStartTime')),
+            yt_date_or_none(stream.get('scheduledEndTime')),
+            stream.get('activeLiveChatId')
+        )
+
+    def _read_topic_details(self, topic_details: dict[str, Any]):
+        self.topic_categories = topic_details.get('topicCategories', None)
+
+    def _read_recording_details(self, recording_details: dict[str, Any]):
+        self.recorded_at = yt_date(recording_details.get('recordingDate'))
+
+    def _read_file_details(self, fileDetails: dict[str, Any]):
+        self.file_details = FileDetails(
+            [FileDetails.VideoStream(
+                v.get('widthPixels'), v.get('heightPixels'), v.get('frameRateFps'),
+                v.get('aspectRatio'), v.get('codec'), v.get('bitrateBps'),
+                v.get('rotation'), v.get('vendor')
+                ) for v in fileDetails.get('videoStreams')],
+            [FileDetails.AudioStream(
+                a.get('channelCount'), a.get('codec'), a.get('bitrateBps'), a.get('vendor')
+                ) for a in fileDetails.get('audioStreams')],
+            fileDetails.get('fileName'),
+            fileDetails.get('fileSize'),
+            fileDetails.get('fileType'),
+            fileDetails.get('container'),
+            fileDetails.get('durationMs'),
+            fileDetails.get('bitrateBps'),
+            yt_date(fileDetails.get('creationTime')),
+        )
+
+    def _read_processing_details(self, processingDetails: dict[str, Any]):
+        progress = processingDetails.get('processingProgress') or _EMPTY
+        self.processing_details = ProcessingDetails(
+            processingDetails.get('processingStatus'),
+            progress.get('partsTotal'),
+            progress.get('partsProcessed'),
+            progress.get('timeLeftMs'),
+            processingDetails.get('processingFailureReason'),
+        )
+
+    def _read_localizations(self, localizations: dict[str, Any]):
+        self.localizations = {
+            k: VideoLocalization(**v) for k, v in localizations.items()
+        }
+
+    # only the parts present in a response are read
+    _PART_READERS: dict[str, Callable[['Video', dict[str, Any]], None]] = {
+        'snippet':              _read_snippet,
+        'contentDetails':       _read_content_details,
+        'status':               _read_status,
+        'statistics':           _read_statistics,
+        'liveStreamingDetails': _read_livestream_details,
+        'topicDetails':         _read_topic_details,
+        'recordingDetails':     _read_recording_details,
+        'fileDetails':          _read_file_details,
+        'processingDetails':    _read_processing_details,
+        'localizations':        _read_localizations,
+    }
 
     def link(self, short: bool = False) -> str:
         if not short:
@@ -416,6 +613,8 @@ class Video:
         return await self._youtube.channel(self.channel_id)
 
 class Playlist:
+    __slots__ = ('_youtube', 'id')
+
     _youtube: 'YouTubeData'
     id: str
 
@@ -427,15 +626,28 @@ class Playlist:
         return F"https://www.youtube.com/playlist?list={self.id}"
 
 class Channel:
+    __slots__ = (
+        '_youtube', 'id',
+        'display_name', 'description', '_created_at', '_created_at_source',
+        'at_username',
+        'profile_image_url',
+        'uploads_playlist',
+        'view_count', 'subscriber_count', 'video_count',
+    )
+
     _youtube: 'YouTubeData'
     id: str
 
     # part: snippet
     display_name: str
     description: str
-    created_at: datetime
     at_username: str
-    profile_image_url: str|None = None
+    profile_image_url: str|None
+
+    @_LazySlot
+    def created_at(self, source: str) -> datetime:
+        '''Timestamp from the snippet, parsed on first access.'''
+        return yt_date(source)
 
     # part: contentDetails
     uploads_playlist: Playlist
@@ -447,33 +659,37 @@ class Channel:
 
     @property
     def custom_url(self):
-        warn("custom_url is deprecated, please use at_username")
+        _warn_deprecated('custom_url', 'at_username')
         return self.at_username
 
     
     @property
     def name(self):
-        warn("name is deprecated, please use display_name")
+        _warn_deprecated('name', 'display_name')
         return self.display_name
 
     def __init__(self, source: dict[str, Any], yt: 'YouTubeData'):
         self._youtube = yt
+        self.profile_image_url = None
 
         self.id = source['id']
         if snippet := source.get('snippet'):
             self.display_name = snippet['title']
             self.description = snippet['description']
-            self.created_at = yt_date(snippet['publishedAt'])
-            self.profile_image_url = snippet.get('thumbnails', {}).get('default', {}).get('url')
+            self._created_at_source = snippet['publishedAt']
+            thumbnails = snippet.get('thumbnails') or _EMPTY
+            self.profile_image_url = (thumbnails.get('default') or _EMPTY).get('url')
             self.at_username = snippet.get('customUrl')
 
         if details := source.get('contentDetails'):
             self.uploads_playlist = Playlist(details['relatedPlaylists']['uploads'], yt)
 
         if stats := source.get('statistics'):
-            self.view_count = int(stats['viewCount'])
-            self.subscriber_count = int(stats['subscriberCount'])
-            self.video_count = int(stats['videoCount'])
+            # subscriberCount is omitted when the channel hides it
+            get = stats.get
+            self.view_count = int(get('viewCount') or 0)
+            self.subscriber_count = int(get('subscriberCount') or 0)
+            self.video_count = int(get('videoCount') or 0)
 
     def link(self) -> str:
         if self.at_username:
@@ -483,20 +699,39 @@ class Channel:
 
     async def update(self):
         new = await self._youtube.channel(self.id)
-        self.__dict__.update(new.__dict__)
+        for name in self.__slots__:
+            if hasattr(new, name):
+                setattr(self, name, getattr(new, name))
 
     def videos(self, limit: int|None=None, mine: bool|None=None) -> AsyncLazy[Video]:
         return self._youtube.search_videos(channel_id=self.id, limit=limit, mine=mine)
 
+# parts supported by each endpoint
+_CHANNEL_PARTS = frozenset({
+    # TODO: auditDetails, brandingSettings, contentOwnerDetails
+    Part.DETAILS,
+    Part.ID,
+    Part.LOCALIZATIONS,
+    Part.SNIPPET,
+    Part.STATISTICS,
+    Part.STATUS,
+    Part.TOPIC_CATEGORIES
+})
+_VIDEO_PARTS = frozenset(Part.ALL_PUBLIC())
+_PLAYLIST_ITEM_PARTS = frozenset({Part.ID, Part.SNIPPET, Part.STATUS, Part.DETAILS})
+_COMMENT_THREAD_PARTS = frozenset({Part.ID, Part.REPLIES, Part.SNIPPET})
+
+# requests in flight at once when fetching resources by ID
+_MAX_CONCURRENT_REQUESTS = 5
+
 class YouTubeData(WebAPI):
     base_url = 'https://www.googleapis.com/youtube/v3'
 
     def __init__(self, app_or_api_key: str|OAuth2|UrlApiKey) -> None:
-        match app_or_api_key:
-            case str():
-                auth = UrlApiKey('key', app_or_api_key)
-            case _:
-                auth = app_or_api_key
+        if isinstance(app_or_api_key, str):
+            auth = UrlApiKey('key', app_or_api_key)
+        else:
+            auth = app_or_api_key
         super().__init__(auth)
 
     async def my_channel(self, parts: Part=Part.SNIPPET) -> Channel:
@@ -516,43 +751,54 @@ class YouTubeData(WebAPI):
         if mine==bool(channel_ids):
             raise ValueError("Must specify exactly one of channel id or mine in channel list query")
         maxResults = min(50, limit) if limit else None # per-page limit
-        allowed = {
-            # TODO: auditDetails, brandingSettings, contentOwnerDetails
-            Part.DETAILS,
-            Part.ID,
-            Part.LOCALIZATIONS,
-            Part.SNIPPET,
-            Part.STATISTICS,
-            Part.STATUS,
-            Part.TOPIC_CATEGORIES
-        }
-        params: ParamsDict = { 'part': parts.intersection(allowed), 'maxResults': maxResults }
+        params: dict[str, str|int|None] = { 'part': _parts_param(parts, _CHANNEL_PARTS), 'maxResults': maxResults }
         if channel_ids:
-            channel_ids = list(set(channel_ids or [])) # deduplicate IDs
-            channels_chunks50 = [
-                channel_ids[i: i + 50] for i in range(0, len(channel_ids), 50)
-            ]
-            async def page_chunks():
-                for ids in channels_chunks50:
-                    p = params | { 'id': ','.join(ids) }
-                    async for c in self.paginated('/channels', p, limit):
-                        yield c
-            return AsyncLazy(page_chunks()).map(lambda r: Channel(r, self))
+            return self._id_chunks('/channels', params, channel_ids, limit, Channel)
         else: # mine
-            return self.paginated(
-                '/channels', params | { 'mine': True }, limit
-                ).map(lambda r: Channel(r, self))
+            params['mine'] = True
+            return self._paginated_channels('/channels', params, limit)
+
+    @AsyncLazy.wrap
+    async def _id_chunks(self,
+        path: str, params: ParamsDict, ids: list[str], limit: int|None,
+        make: Callable[[JsonMap, 'YouTubeData'], T]) -> AsyncGenerator[T, None]:
+        '''
+        Request resources by ID, at most 50 per request and a few requests at a time.
+        Resources are yielded in ID order, each chunk as soon as its response arrives.
+        '''
+        ids = list(dict.fromkeys(ids)) # deduplicate IDs, keep order
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        async def chunk(chunk_ids: list[str]) -> list[JsonMap]:
+            async with semaphore:
+                return await self.paginated(path, params | { 'id': ','.join(chunk_ids) }, limit)
+        tasks = [asyncio.create_task(chunk(ids[i: i + 50])) for i in range(0, len(ids), 50)]
+        try:
+            for task in tasks:
+                for item in await task:
+                    yield make(item, self)
+        finally:
+            # after a failed request or an early break, stop the requests in flight
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @AsyncLazy.wrap
+    async def _paginated_channels(self,
+        path: str, params: ParamsDict, limit: int|None) -> AsyncGenerator[Channel, None]:
+        async for r in self.paginated(path, params, limit):
+            yield Channel(r, self)
+
+    @AsyncLazy.wrap
+    async def _paginated_videos(self,
+        path: str, params: ParamsDict, limit: int|None) -> AsyncGenerator[Video, None]:
+        async for r in self.paginated(path, params, limit):
+            yield Video(r, self)
 
     def videos(self,
         video_ids: list[str],
         parts: Part|set[Part]={Part.ID,Part.SNIPPET}) -> AsyncLazy[Video]:
-        params: ParamsDict = {
-            'part': parts.intersection(Part.ALL_PUBLIC()),
-            'id': ','.join(video_ids),
-        }
-        return self.paginated(
-            '/videos', params, None
-            ).map(lambda r: Video(r, self))
+        params: ParamsDict = { 'part': _parts_param(parts, _VIDEO_PARTS) }
+        return self._id_chunks('/videos', params, video_ids, None, Video)
 
     async def video(self, id: str, parts: Part|set[Part]={Part.ID,Part.SNIPPET}) -> Video:
         return (await self.videos([id], parts))[0]
@@ -562,14 +808,11 @@ class YouTubeData(WebAPI):
         parts: Part|set[Part]={Part.SNIPPET, Part.DETAILS},
         limit: int|None=None) -> AsyncLazy[Video]:
         params: ParamsDict = {
-            'part': parts.intersection(
-                {Part.ID, Part.SNIPPET, Part.STATUS, Part.DETAILS}),
+            'part': _parts_param(parts, _PLAYLIST_ITEM_PARTS),
             'playlistId': playlist_id,
             'maxResults': min(50, limit) if limit else None,
         }
-        return self.paginated(
-            '/playlistItems', params, limit
-            ).map(lambda r: Video(r, self))
+        return self._paginated_videos('/playlistItems', params, limit)
 
     def search_videos(self,
         query: str|None=None,
@@ -587,22 +830,26 @@ class YouTubeData(WebAPI):
         The `mine` parameter can be used instead of `channel_id` if authorized
         by the channel owner via OAuth2.
         '''
-        params: ParamsDict = {
-            'part': Part.SNIPPET,
-            'safeSearch': safeSearch,
-            'order': order,
+        params: dict[str, str|int] = {
+            'part': Part.SNIPPET.value,
+            'safeSearch': safeSearch.value,
+            'order': order.value,
             'type': 'video',
-            'q': query,
-            'channelId': channel_id,
-            'forMine': mine,
-            'publishedAfter': after.astimezone(timezone.utc).isoformat("T")[:-6] + "Z" if after else None,
-            'publishedBefore': before.astimezone(timezone.utc).isoformat("T")[:-6] + "Z" if before else None,
-            'maxResults': min(50, limit) if limit else None,
         }
-
-        return self.paginated(
-            '/search', params, limit
-            ).map(lambda r: Video(r, self))
+        if query is not None:
+            params['q'] = query
+        if channel_id is not None:
+            params['channelId'] = channel_id
+        if mine is not None:
+            params['forMine'] = mine
+        if after:
+            params['publishedAfter'] = _iso_utc(after)
+        if before:
+            params['publishedBefore'] = _iso_utc(before)
+        if limit:
+            params['maxResults'] = min(50, limit)
+
+        return self._paginated_videos('/search', params, limit)
 
     def comments(self,
         video_id: str,
@@ -611,8 +858,8 @@ class YouTubeData(WebAPI):
         order: CommentOrder=CommentOrder.TIME,
         limit: int|None=None) -> AsyncLazy[Comment]:
         params: ParamsDict = {
-            'part': parts.intersection({Part.ID, Part.REPLIES, Part.SNIPPET}),
-            'commentOrder': order,
+            'part': _parts_param(parts, _COMMENT_THREAD_PARTS),
+            'commentOrder': order.value,
             'searchTerms': query,
             'videoId': video_id,
             'maxResults': min(100, limit) if limit else None,
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+import pytest
+from SlyYTDAPI import *
+from SlyYTDAPI import ytdapi
+from SlyYTDAPI.ytdapi import _parse_iso_duration
+
+# the fromisoformat branch and the slicing parser used before Python 3.11
+@pytest.mark.parametrize('fromisoformat_full', [True, False])
+def test_yt_date(monkeypatch: pytest.MonkeyPatch, fromisoformat_full: bool):
+    monkeypatch.setattr(ytdapi, '_FROMISOFORMAT_FULL', fromisoformat_full)
+    assert yt_date('2023-07-30T12:34:56Z') == datetime(2023, 7, 30, 12, 34, 56, tzinfo=timezone.utc)
+    assert yt_date('2023-07-30T12:34:56.Z') == datetime(2023, 7, 30, 12, 34, 56, tzinfo=timezone.utc)
+    assert yt_date('2023-07-30T12:34:56.5Z') == datetime(2023, 7, 30, 12, 34, 56, 500000, tzinfo=timezone.utc)
+    assert yt_date('2023-07-30T12:34:56.123456Z') == datetime(2023, 7, 30, 12, 34, 56, 123456, tzinfo=timezone.utc)
+    assert yt_date('2023-07-30T12:34:56.1234567Z') == datetime(2023, 7, 30, 12, 34, 56, 123456, tzinfo=timezone.utc)
+    assert yt_date('2023-07-30T12:34:56+00:00') == datetime(2023, 7, 30, 12, 34, 56, tzinfo=timezone.utc)
+    assert yt_date('2023-07-30T12:34:56Z').tzinfo is not None
+    assert yt_date('') is None
+    with pytest.raises(ValueError):
+        yt_date('garbageZ')
+    with pytest.raises(ValueError):
+        yt_date('2023-07-30T12:34:56.12aZ')
+
+def test_iso_duration():
+    assert _parse_iso_duration('PT4M13S') == 253
+    assert _parse_iso_duration('PT1M') == 60
+    assert _parse_iso_duration('PT1H2M3S') == 3723
+    assert _parse_iso_duration('P1D') == 86400
+    assert _parse_iso_duration('P1DT2H') == 93600
+    assert _parse_iso_duration('PT123S') == 123
+    assert _parse_iso_duration('P0D') == 0
+    assert _parse_iso_duration('PT10H0M1S') == 36001
+    assert _parse_iso_duration('P2DT1S') == 172801
+    assert _parse_iso_duration('P1W') == 604800
+    assert _parse_iso_duration('P1WT1H') == 608400
+    with pytest.raises(ValueError): # months are not a fixed length
+        _parse_iso_duration('P1M')
+    with pytest.raises(ValueError):
+        _parse_iso_duration('PT1H2H')
+    with pytest.raises(ValueError):
+        _parse_iso_duration('PT1S1M')
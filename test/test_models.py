@@ -0,0 +1,256 @@
+from datetime import datetime, timezone
+from typing import Any
+import asyncio
+import warnings
+import pytest
+from SlyYTDAPI import *
+from SlyYTDAPI import ytdapi
+
+def test_channel_hidden_subscriber_count():
+    channel = Channel({'id': 'x', 'statistics': {
+        'viewCount': '1', 'videoCount': '2', 'hiddenSubscriberCount': True}}, None)
+    assert channel.subscriber_count == 0
+    assert channel.view_count == 1
+    assert channel.video_count == 2
+
+VIDEO = {
+    'kind': 'youtube#video',
+    'id': 'abc',
+    'snippet': {
+        'title': 'Title',
+        'description': 'Description',
+        'publishedAt': '2023-07-30T12:34:56Z',
+        'channelId': 'UC123',
+        'channelTitle': 'Channel',
+        'tags': ['a', 'b'],
+        'liveBroadcastContent': 'none',
+        'thumbnails': {'default': {'url': 'https://i.ytimg.com/a.jpg'}},
+        'localized': {'title': 'Titel', 'description': 'Beschreibung'},
+    },
+    'contentDetails': {'duration': 'PT4M13S', 'definition': 'hd'},
+    'status': {'privacyStatus': 'public', 'embeddable': True},
+    'statistics': {'viewCount': '10', 'likeCount': '2', 'commentCount': '1'},
+    'liveStreamingDetails': {'scheduledStartTime': '2023-07-30T12:00:00Z'},
+    'topicDetails': {'topicCategories': ['https://en.wikipedia.org/wiki/Music']},
+    'recordingDetails': {'recordingDate': '2023-07-29T00:00:00Z'},
+    'processingDetails': {'processingStatus': 'succeeded'},
+    'localizations': {'de': {'title': 'Titel', 'description': 'Beschreibung'}},
+}
+
+def test_video_parts():
+    video = Video(VIDEO, None) # type: ignore
+    assert video.id == 'abc'
+    # snippet
+    assert video.title == 'Title'
+    assert video.published_at == datetime(2023, 7, 30, 12, 34, 56, tzinfo=timezone.utc)
+    assert (video.channel_id, video.channel_name) == ('UC123', 'Channel')
+    assert video.tags == ['a', 'b']
+    assert not video.is_livestream
+    assert video.thumbnails == ['https://i.ytimg.com/a.jpg']
+    assert video.localized_title == 'Titel'
+    # contentDetails
+    assert video.duration == 253
+    assert video.content_details is not None
+    assert video.content_details.definition == 'hd'
+    # status
+    assert video.privacy == PrivacyStatus.PUBLIC
+    assert video.status_details is not None
+    assert video.status_details.is_embeddable
+    # statistics
+    assert (video.view_count, video.like_count, video.comment_count) == (10, 2, 1)
+    # liveStreamingDetails
+    assert video.livestream_details is not None
+    assert video.livestream_details.scheduled_start == datetime(2023, 7, 30, 12, tzinfo=timezone.utc)
+    assert video.livestream_details.started_at is None
+    # topicDetails, recordingDetails, processingDetails, localizations
+    assert video.topic_categories == ['https://en.wikipedia.org/wiki/Music']
+    assert video.recorded_at == datetime(2023, 7, 29, tzinfo=timezone.utc)
+    assert video.processing_details is not None
+    assert video.processing_details.status == 'succeeded'
+    assert video.localizations == {'de': VideoLocalization('Titel', 'Beschreibung')}
+
+def test_video_missing_parts():
+    video = Video({'id': 'abc'}, None) # type: ignore
+    assert video.published_at is None
+    assert video.duration is None
+    assert video.view_count == 0
+    assert video.localizations is None
+
+def test_video_playlist_item():
+    video = Video({
+        'kind': 'youtube#playlistItem',
+        'id': 'UExpdGVtMQ',
+        'snippet': {'title': 'Title'},
+        # playlist items have no duration, only the video's ID
+        'contentDetails': {'videoId': 'abc', 'videoPublishedAt': '2023-07-30T12:34:56Z'},
+    }, None) # type: ignore
+    assert video.id == 'abc'
+    assert video.title == 'Title'
+    assert video.duration is None
+    assert video.content_details is None
+
+def test_video_search_result():
+    video = Video({
+        'kind': 'youtube#searchResult',
+        'id': {'kind': 'youtube#video', 'videoId': 'abc'},
+        'snippet': {'title': 'Title'},
+    }, None) # type: ignore
+    assert video.id == 'abc'
+    assert video.title == 'Title'
+
+def test_video_to_dict():
+    d = Video(VIDEO, None).to_dict() # type: ignore
+    assert d['id'] == 'abc'
+    assert d['published_at'] == datetime(2023, 7, 30, 12, 34, 56, tzinfo=timezone.utc)
+    assert d['thumbnails'] == ['https://i.ytimg.com/a.jpg']
+    assert d['duration'] == 253
+    # dataclass members become plain dicts
+    assert d['content_details']['definition'] == 'hd'
+    assert d['status_details']['privacy'] == 'public'
+    assert d['livestream_details']['started_at'] is None
+    assert d['file_details'] is None
+    assert d['localizations'] == {'de': VideoLocalization('Titel', 'Beschreibung')}
+
+def fake_get_json(yt: YouTubeData, path: str, chunk_sizes: list[int], fail: str|None=None, slow: float=0):
+    '''Answer requests by ID with one item per ID, raising for the chunk starting with `fail`.'''
+    async def get_json(p: str, params: dict[str, Any]|None=None, *args: Any, **kwargs: Any):
+        assert p == path and params is not None
+        ids = params['id'].split(',')
+        chunk_sizes.append(len(ids))
+        if ids[0] == fail:
+            raise RuntimeError(F"request for {fail} failed")
+        if ids[0] != 'v0':
+            await asyncio.sleep(slow)
+        return {'items': [{'id': id} for id in ids]}
+    yt.get_json = get_json # type: ignore
+
+async def other_tasks_finished() -> bool:
+    '''Let the event loop run until only the calling task is left.'''
+    for _ in range(100):
+        if len(asyncio.all_tasks()) == 1:
+            return True
+        await asyncio.sleep(0)
+    return False
+
+async def test_video_id_chunks():
+    yt = YouTubeData('key')
+    chunk_sizes: list[int] = []
+    fake_get_json(yt, '/videos', chunk_sizes)
+
+    ids = [F"v{i}" for i in range(120)]
+    videos = await yt.videos(ids + ids[:1]) # 121 IDs, the duplicate is requested once
+    assert sorted(chunk_sizes) == [20, 50, 50]
+    assert [v.id for v in videos] == ids
+
+async def test_video_id_chunks_failure():
+    yt = YouTubeData('key')
+    fake_get_json(yt, '/videos', [], fail='v50', slow=10)
+
+    received: list[str] = []
+    with pytest.raises(RuntimeError):
+        async for v in yt.videos([F"v{i}" for i in range(300)]):
+            received.append(v.id)
+    # the chunk before the failure is kept, the requests still in flight are cancelled
+    assert received == [F"v{i}" for i in range(50)]
+    assert await other_tasks_finished()
+
+async def test_video_id_chunks_early_break():
+    yt = YouTubeData('key')
+    fake_get_json(yt, '/videos', [], slow=10)
+
+    async for v in yt.videos([F"v{i}" for i in range(300)]):
+        assert v.id == 'v0' # first chunk is yielded before the others arrive
+        break
+    # the abandoned generator is closed by the event loop, cancelling the requests in flight
+    assert await other_tasks_finished()
+
+async def test_channel_id_chunks():
+    yt = YouTubeData('key')
+    chunk_sizes: list[int] = []
+    fake_get_json(yt, '/channels', chunk_sizes)
+
+    ids = [F"UC{i}" for i in range(75)]
+    channels = await yt.channels(ids + ids[::-1], Part.SNIPPET) # duplicates are requested once
+    assert sorted(chunk_sizes) == [25, 50]
+    assert [c.id for c in channels] == ids
+
+def comment_snippet(text: str) -> dict[str, Any]:
+    return {
+        'authorDisplayName': '@someone',
+        'authorChannelId': {'value': 'UC123'},
+        'textDisplay': text,
+        'publishedAt': '2023-07-30T12:34:56Z',
+    }
+
+def test_comment_thread():
+    comment = Comment({
+        'kind': 'youtube#commentThread',
+        'id': 'thread',
+        'snippet': {
+            'topLevelComment': {'id': 'top', 'snippet': comment_snippet('Hello')},
+        },
+        'replies': {'comments': [
+            {'id': 'top.r1', 'snippet': comment_snippet('Hi')},
+            {'id': 'top.r2', 'snippet': comment_snippet('Hey')},
+        ]},
+    })
+    assert comment.id == 'top'
+    assert comment.body == 'Hello'
+    assert comment.author_channel_id == 'UC123'
+    assert comment.created_at == datetime(2023, 7, 30, 12, 34, 56, tzinfo=timezone.utc)
+    assert comment.replies is not None
+    assert [r.id for r in comment.replies] == ['top.r1', 'top.r2']
+    assert [r.body for r in comment.replies] == ['Hi', 'Hey']
+    assert comment.replies[0].replies is None
+    assert comment.replies[0].created_at == datetime(2023, 7, 30, 12, 34, 56, tzinfo=timezone.utc)
+
+def test_comment_thread_without_replies():
+    comment = Comment({
+        'id': 'thread',
+        'snippet': {
+            'topLevelComment': {'id': 'top', 'snippet': comment_snippet('Hello')},
+        },
+    })
+    assert comment.id == 'top'
+    assert comment.replies == []
+
+def test_comment_reply():
+    comment = Comment({'kind': 'youtube#comment', 'id': 'top.r1', 'snippet': comment_snippet('Hi')})
+    assert comment.id == 'top.r1'
+    assert comment.body == 'Hi'
+    assert comment.replies is None
+    assert comment.created_at == datetime(2023, 7, 30, 12, 34, 56, tzinfo=timezone.utc)
+
+def test_deprecated_properties_warn_once(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ytdapi, '_warned', set())
+    comment = Comment({'id': 'c', 'snippet': comment_snippet('Hi')})
+    channel = Channel({'id': 'x', 'snippet': {
+        'title': 'Channel', 'description': '', 'customUrl': '@channel',
+        'publishedAt': '2023-07-30T12:34:56Z'}}, None) # type: ignore
+    with pytest.warns(DeprecationWarning) as record:
+        for _ in range(2):
+            assert comment.author_name == '@someone'
+            assert channel.name == 'Channel'
+            assert channel.custom_url == '@channel'
+    assert [str(w.message).split()[0] for w in record] == ['author_name', 'name', 'custom_url']
+    assert all(w.filename == __file__ for w in record)
+
+def test_deprecated_property_error_filter(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ytdapi, '_warned', set())
+    channel = Channel({'id': 'x', 'snippet': {
+        'title': 'Channel', 'description': '', 'publishedAt': '2023-07-30T12:34:56Z'}}, None) # type: ignore
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        with pytest.raises(DeprecationWarning):
+            channel.name
+    # the raised warning did not count as issued
+    with pytest.warns(DeprecationWarning):
+        assert channel.name == 'Channel'
+
+def test_get_dict_path():
+    d = {'a': {'b': 'c', 'n': None}, 'l': [1]}
+    assert get_dict_path(d, 'a', 'b') == 'c'
+    assert get_dict_path(d, 'a', 'n') is None
+    assert get_dict_path(d, 'a', 'x') is None
+    assert get_dict_path(d, 'a', 'b', 'c') is None # str in the middle of the path
+    assert get_dict_path(d, 'l', 'x') is None